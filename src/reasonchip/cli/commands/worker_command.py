@@ -87,6 +87,13 @@ It's an incredibly intolerant process by design. It will die if anything strange
             default=4,
             help="The number of tasks to run in parallel",
         )
+        parser.add_argument(
+            "--no-stacktrace",
+            dest="include_stacktrace",
+            action="store_false",
+            default=True,
+            help="Do not send exception stacktraces back to the broker",
+        )
 
         cls.add_default_options(parser)
         cls.add_db_options(parser)
@@ -138,6 +145,7 @@ It's an incredibly intolerant process by design. It will die if anything strange
                 engine=engine,
                 transport=transport,
                 max_capacity=args.tasks,
+                include_stacktrace=args.include_stacktrace,
             )
             await tm.start()
 
@@ -8,6 +8,13 @@ import argparse
 import asyncio
 import setproctitle
 
+try:
+    import uvloop
+
+    run_async = uvloop.run
+except ImportError:
+    run_async = asyncio.run
+
 from ..core.logging.configure import configure_logging
 
 from .commands import get_commands, AsyncCommand, ExitCode
@@ -59,7 +66,7 @@ def main() -> ExitCode:
 
     # Dispatch appropriately
     if isinstance(obj, AsyncCommand):
-        rc = asyncio.run(obj.main(myargs, remaining))
+        rc = run_async(obj.main(myargs, remaining))
     else:
         rc = obj.main(myargs, remaining)
 
@@ -161,3 +161,37 @@ async def send_packet(
     except:
         logging.debug("Failed to write packet to stream", exc_info=True)
         return False
+
+
+async def send_packets(
+    writer: asyncio.StreamWriter,
+    requests: typing.List[SocketPacket],
+) -> bool:
+    """
+    Send several packets to the writer stream with a single write.
+
+    In the case of receiving False from this function, the connection should be
+    regarded as dead and unrecoverable.
+
+    :param writer: The writer stream.
+    :param requests: The packets to send.
+
+    :return: True if the packets were sent successfully, False otherwise.
+    """
+    try:
+        logging.debug(f"Sending {len(requests)} packets to stream")
+
+        chunks = []
+        for request in requests:
+            msg_bytes = request.model_dump_json().encode("utf-8")
+            chunks.append(struct.pack("!I", len(msg_bytes)))
+            chunks.append(msg_bytes)
+
+        writer.writelines(chunks)
+        await writer.drain()
+
+        logging.debug("Packets written to stream")
+        return True
+    except:
+        logging.debug("Failed to write packets to stream", exc_info=True)
+        return False
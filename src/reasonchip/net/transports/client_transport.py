@@ -29,3 +29,9 @@ class ClientTransport(ABC):
 
     @abstractmethod
     async def send_packet(self, packet: SocketPacket) -> bool: ...
+
+    async def send_packets(self, packets: typing.List[SocketPacket]) -> bool:
+        for packet in packets:
+            if not await self.send_packet(packet):
+                return False
+        return True
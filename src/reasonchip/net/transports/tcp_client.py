@@ -8,7 +8,12 @@ import uuid
 import asyncio
 import logging
 
-from ..protocol import receive_packet, send_packet, SocketPacket
+from ..protocol import (
+    receive_packet,
+    send_packet,
+    send_packets,
+    SocketPacket,
+)
 
 from .client_transport import ClientTransport, ReadCallbackType
 
@@ -139,6 +144,10 @@ class TcpClient(ClientTransport):
         assert self._writer
         return await send_packet(self._writer, packet)
 
+    async def send_packets(self, packets: typing.List[SocketPacket]) -> bool:
+        assert self._writer
+        return await send_packets(self._writer, packets)
+
     async def _loop(self):
         assert self._reader
         assert self._callback
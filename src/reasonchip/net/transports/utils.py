@@ -35,6 +35,26 @@ from ..protocol import (
     DEFAULT_WORKER_PORT_GRPC,
 )
 
+SCHEMES: typing.Tuple[str, ...] = ("grpc://", "tcp://", "http://", "socket://")
+
+TARGET_PATTERN = re.compile(
+    r"""
+    (?P<target>
+        (?:                                       # Start non-capturing group for target
+            \[[0-9a-fA-F:]+\](?::\d+)?            # IPv6 (with optional port)
+            |
+            \d{1,3}(?:\.\d{1,3}){3}(?::\d+)?      # IPv4 (with optional port)
+            |
+            [a-zA-Z0-9.-]+(?::\d+)?               # Hostname (with optional port)
+            |
+            /[^ ]+                                # Unix path
+        )
+    )
+    /?$                                           # Trailing slash
+""",
+    re.VERBOSE,
+)
+
 
 class ClientType(enum.IntEnum):
     WORKER = enum.auto()
@@ -67,7 +87,7 @@ def get_port(scheme: str, client_type: ClientType) -> int:
 # ------------------- SUPPORT CLASSES ----------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionTarget:
     raw_target: str
     host: typing.Optional[str] = None
@@ -107,7 +127,7 @@ class ConnectionTarget:
             self.port = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TransportOptions:
     scheme: str
     target: str
@@ -117,32 +137,16 @@ class TransportOptions:
         """
         Create a TransportOptions instance from command line arguments.
         """
-        pattern = re.compile(
-            r"""
-            ^
-            (?P<scheme>grpc|tcp|http|socket)://           # Scheme
-            (?P<target>
-                (?:                                       # Start non-capturing group for target
-                    \[[0-9a-fA-F:]+\](?::\d+)?            # IPv6 (with optional port)
-                    |
-                    \d{1,3}(?:\.\d{1,3}){3}(?::\d+)?      # IPv4 (with optional port)
-                    |
-                    [a-zA-Z0-9.-]+(?::\d+)?               # Hostname (with optional port)
-                    |
-                    /[^ ]+                                # Unix path
-                )
-            )
-            /?$                                           # Trailing slash
-        """,
-            re.VERBOSE,
-        )
+        scheme = next((x for x in SCHEMES if url.startswith(x)), None)
+        if scheme is None:
+            raise ValueError(f"Invalid URL format: {url}")
 
-        match = pattern.match(url)
+        match = TARGET_PATTERN.match(url, len(scheme))
         if not match:
             raise ValueError(f"Invalid URL format: {url}")
 
         return TransportOptions(
-            scheme=match.group("scheme"),
+            scheme=scheme[:-3],
             target=match.group("target"),
         )
 
@@ -7,9 +7,12 @@ import typing
 import uuid
 import asyncio
 import traceback
-import json
 import logging
 import time
+import collections
+import contextvars
+
+import orjson
 
 from dataclasses import dataclass
 
@@ -25,8 +28,64 @@ from ..protocol import (
     ResultCode,
 )
 
+# Seconds to wait on the transport before giving up on a batch of results
+RESULT_SEND_TIMEOUT: float = 30.0
+
+# Results whose encoding is estimated above this many bytes are serialized
+# off the event loop
+OFFLOAD_THRESHOLD: int = 256 * 1024
+
+# Tracebacks with more frames than this are formatted off the event loop
+TRACEBACK_OFFLOAD_DEPTH: int = 64
+
+
+def _dumps(rc: typing.Any) -> str:
+    return orjson.dumps(rc, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _exceeds_size(rc: typing.Any, limit: int) -> bool:
+    """
+    Cheaply estimate whether the JSON encoding of rc exceeds limit bytes.
+
+    The walk gives up as soon as the budget is spent, so it never visits
+    more than about limit / 2 values.
+    """
+    budget = limit
+    stack = [rc]
+
+    while stack:
+        o = stack.pop()
+
+        if isinstance(o, (str, bytes)):
+            budget -= len(o) + 2
+        elif isinstance(o, dict):
+            budget -= 2 * len(o) + 2
+            if budget >= 0:
+                stack.extend(o.keys())
+                stack.extend(o.values())
+        elif isinstance(o, (list, tuple, set)):
+            budget -= len(o) + 2
+            if budget >= 0:
+                stack.extend(o)
+        else:
+            budget -= 8
+
+        if budget < 0:
+            return True
+
+    return False
 
-@dataclass
+
+def _tb_depth(e: BaseException) -> int:
+    depth = 0
+    tb = e.__traceback__
+    while tb is not None:
+        depth += 1
+        tb = tb.tb_next
+    return depth
+
+
+@dataclass(slots=True)
 class TaskInfo:
     cookie: uuid.UUID
     task: typing.Optional[asyncio.Task] = None
@@ -38,13 +97,23 @@ class TaskManager:
     to a server.
     """
 
+    _HANDLERS: typing.Dict[PacketType, str] = {
+        PacketType.SHUTDOWN: "_srv_shutdown",
+        PacketType.RUN: "_srv_run",
+        PacketType.CANCEL: "_srv_cancel",
+    }
+
+    # RESULT packets are shallow copies of this, skipping validation
+    _RESULT_TEMPLATE: SocketPacket = SocketPacket(packet_type=PacketType.RESULT)
+
     def __init__(
         self,
         engine: Engine,
         transport: ClientTransport,
         max_capacity: int = 4,
+        include_stacktrace: bool = True,
     ):
-        logging.debug(f"Creating TaskManager with capacity {max_capacity}")
+        logging.debug("Creating TaskManager with capacity %d", max_capacity)
 
         assert max_capacity > 0
 
@@ -52,16 +121,36 @@ class TaskManager:
         self._engine: Engine = engine
         self._transport: ClientTransport = transport
         self._max_capacity: int = max_capacity
+        self._include_stacktrace: bool = include_stacktrace
 
-        # Streams
-        self._incoming_queue: asyncio.Queue = asyncio.Queue()
+        # Streams (bounded so a flooding server blocks the transport reader)
+        self._incoming_queue: asyncio.Queue[typing.Optional[SocketPacket]] = (
+            asyncio.Queue(maxsize=max(16, max_capacity * 4))
+        )
 
         # Multiplexing
         self._dying: asyncio.Event = asyncio.Event()
         self._handler: typing.Optional[asyncio.Task] = None
         self._tasks: typing.Dict[uuid.UUID, TaskInfo] = {}
+        self._completions: asyncio.Queue[uuid.UUID] = asyncio.Queue()
+        self._free: typing.Deque[TaskInfo] = collections.deque(
+            maxlen=max_capacity
+        )
+
+        # Results are coalesced and written in batches
+        self._pending_results: typing.List[SocketPacket] = []
+        self._flusher: typing.Optional[asyncio.Task] = None
+
+        # Internal tasks carry no application state; skip the context copy
+        self._empty_ctx: contextvars.Context = contextvars.Context()
 
-        logging.debug(f"TaskManager created")
+        # Packet dispatch, bound once
+        self._handlers: typing.Dict[
+            PacketType,
+            typing.Callable[[SocketPacket], typing.Awaitable[bool]],
+        ] = {pt: getattr(self, name) for pt, name in self._HANDLERS.items()}
+
+        logging.debug("TaskManager created")
 
     # ------------------------- LIFECYCLE ------------------------------------
 
@@ -117,7 +206,7 @@ class TaskManager:
         return True
 
     async def stop(self, timeout: typing.Optional[float] = None) -> bool:
-        logging.debug(f"Stopping TaskManager...")
+        logging.debug("Stopping TaskManager...")
 
         if not self._dying.is_set():
             self._dying.set()
@@ -132,106 +221,137 @@ class TaskManager:
 
     # ------------------------- PLEXORS --------------------------------------
 
+    def _spawn(self, coro: typing.Coroutine) -> asyncio.Task:
+        return asyncio.create_task(coro, context=self._empty_ctx)
+
     async def _incoming_packet(
         self,
         cookie: uuid.UUID,
         packet: typing.Optional[SocketPacket],
-    ):
-        logging.debug(f"Received packet on task manager")
-        await self._incoming_queue.put(packet)
+    ) -> None:
+        logging.debug("Received packet on task manager")
 
-    async def _wait_for_engine(
-        self,
-        task: asyncio.Task,
-        cookie: uuid.UUID,
-    ) -> uuid.UUID:
+        # Nothing reads the queue once dying, so never block the transport
+        if self._dying.is_set():
+            if packet is not None:
+                logging.debug("Dropping packet received while dying")
+                return
 
-        logging.debug(f"Waiting for engine run to complete: {cookie}")
+            # Make room for the EOF sentinel; queued packets are moot now
+            while self._incoming_queue.full():
+                self._incoming_queue.get_nowait()
 
-        # Wait for an engine run to complete
-        done, _ = await asyncio.wait(
-            [task],
-            return_when=asyncio.ALL_COMPLETED,
-        )
-        assert done
+            self._incoming_queue.put_nowait(None)
+            return
 
-        ex = task.exception()
-        assert ex is None
-        return cookie
+        try:
+            self._incoming_queue.put_nowait(packet)
+        except asyncio.QueueFull:
+            await self._incoming_queue.put(packet)
+
+    async def _multiplexing(self) -> None:
 
-    async def _multiplexing(self):
+        logging.debug("Entering multiplexing loop")
 
-        logging.debug(f"Entering multiplexing loop")
+        # One-shot: never recreated, dropped from the wait set once it fires
+        t_dying: typing.Optional[asyncio.Task] = self._spawn(self._dying.wait())
+        t_incoming: typing.Optional[asyncio.Task] = self._spawn(
+            self._incoming_queue.get()
+        )
+        t_done: asyncio.Task = self._spawn(self._completions.get())
 
-        t_dying = asyncio.create_task(self._dying.wait())
-        t_incoming = asyncio.create_task(self._incoming_queue.get())
+        # Only the task that fired is ever replaced in the wait set
+        wl: typing.Set[asyncio.Task] = {t_dying, t_incoming, t_done}
 
-        wl = [t_dying, t_incoming]
+        # Hoisted lookups for the loop body
+        tasks = self._tasks
+        free = self._free
+        is_dying = self._dying.is_set
+        next_completion = self._completions.get_nowait
+        next_packet = self._incoming_queue.get_nowait
 
-        while wl:
+        while t_dying or t_incoming or tasks:
             done, _ = await asyncio.wait(
                 wl,
                 return_when=asyncio.FIRST_COMPLETED,
             )
-            assert done
 
-            # Handle tasks
-            for t in done:
-                if t in (t_dying, t_incoming):
-                    continue
+            # Handle engine completions
+            if t_done in done:
+                cookie = t_done.result()
 
-                cookie = t.result()
-                assert isinstance(cookie, uuid.UUID)
-                self._tasks.pop(cookie)
+                while True:
+                    task_info = tasks.pop(cookie)
+                    task_info.task = None
+                    free.append(task_info)
 
-                logging.debug(f"Recognized task completion: {cookie}")
+                    logging.debug("Recognized task completion: %s", cookie)
+
+                    try:
+                        cookie = next_completion()
+                    except asyncio.QueueEmpty:
+                        break
+
+                wl.discard(t_done)
+                t_done = self._spawn(self._completions.get())
+                wl.add(t_done)
 
             # Consider death
             if t_dying in done:
-                assert t_dying and t_dying.done()
+                wl.discard(t_dying)
                 t_dying = None
 
                 logging.debug("Started dying because we were requested to die")
 
-                if t_incoming:
+                if t_incoming and not t_incoming.done():
                     t_incoming.cancel()
+                    wl.discard(t_incoming)
+                    t_incoming = None
 
             # Receiving a packet
             if t_incoming in done:
-                assert t_incoming and t_incoming.done()
-
                 logging.debug("Received packet on incoming queue")
 
                 rc = t_incoming.result()
 
+                wl.discard(t_incoming)
                 t_incoming = None
 
-                assert rc is None or isinstance(rc, SocketPacket)
+                # Drain whatever else has already arrived in this burst
+                while True:
+                    restart = await self._process_server_packet(rc)
+                    if not restart or is_dying():
+                        break
 
-                restart = await self._process_server_packet(rc)
+                    try:
+                        rc = next_packet()
+                    except asyncio.QueueEmpty:
+                        break
 
                 # Restart the task if advised and we're not dying
-                if restart and not self._dying.is_set():
+                dying = is_dying()
+                if restart and not dying:
                     logging.debug("Restarting the incoming queue task")
-                    t_incoming = asyncio.create_task(self._incoming_queue.get())
+                    t_incoming = self._spawn(self._incoming_queue.get())
+                    wl.add(t_incoming)
                 else:
-                    if not self._dying.is_set():
+                    if not dying:
                         self._dying.set()
                     logging.debug("Not restarting the incoming queue task")
 
-            # Rebuild the waiting list, adding any running engines
-            wl = [x for x in (t_dying, t_incoming) if x is not None]
+        t_done.cancel()
 
-            for t in self._tasks.values():
-                assert t.task is not None
-                wl.append(
-                    asyncio.create_task(self._wait_for_engine(t.task, t.cookie))
-                )
+        # Results of finished engines must not be lost on the way out
+        if self._flusher:
+            try:
+                await asyncio.shield(self._flusher)
+            except Exception:
+                logging.exception("Failed to flush results before exiting")
 
         assert self._transport is not None
         await self._transport.disconnect()
 
-        logging.debug(f"Exiting multiplexing loop")
+        logging.debug("Exiting multiplexing loop")
 
     # ------------------------- HANDLERS -------------------------------------
 
@@ -246,16 +366,12 @@ class TaskManager:
             return False
 
         logging.debug(
-            f"Processing server packet: [{packet.packet_type}] [{packet.cookie}]"
+            "Processing server packet: [%s] [%s]",
+            packet.packet_type,
+            packet.cookie,
         )
 
-        handlers = {
-            PacketType.SHUTDOWN: self._srv_shutdown,
-            PacketType.RUN: self._srv_run,
-            PacketType.CANCEL: self._srv_cancel,
-        }
-
-        handler = handlers.get(
+        handler = self._handlers.get(
             packet.packet_type, self._srv_unsupported_packet_type
         )
         return await handler(packet)
@@ -283,7 +399,11 @@ class TaskManager:
             return False
 
         # Create a new task
-        task_info = TaskInfo(cookie=packet.cookie)
+        if self._free:
+            task_info = self._free.pop()
+            task_info.cookie = packet.cookie
+        else:
+            task_info = TaskInfo(cookie=packet.cookie)
         self._tasks[packet.cookie] = task_info
 
         task_info.task = asyncio.create_task(
@@ -293,6 +413,9 @@ class TaskManager:
                 variables=packet.variables,
             )
         )
+        task_info.task.add_done_callback(
+            lambda _, c=packet.cookie: self._completions.put_nowait(c)
+        )
 
         return True
 
@@ -311,7 +434,7 @@ class TaskManager:
             )
             return True
 
-        logging.info(f"Cancelling task: [{packet.cookie}]")
+        logging.info("Cancelling task: [%s]", packet.cookie)
 
         task_info = self._tasks[packet.cookie]
         assert task_info.task is not None
@@ -326,6 +449,38 @@ class TaskManager:
         logging.fatal(f"Unsupported packet type: [{packet.packet_type}]")
         return False
 
+    # ------------------------- RESULTS --------------------------------------
+
+    def _queue_result(self, packet: SocketPacket) -> None:
+        self._pending_results.append(packet)
+        if self._flusher is None:
+            self._flusher = self._spawn(self._flush_results())
+
+    async def _flush_results(self) -> None:
+        try:
+            while self._pending_results:
+                batch = self._pending_results
+                self._pending_results = []
+
+                logging.debug("Sending %d result packets", len(batch))
+                try:
+                    await asyncio.wait_for(
+                        self._transport.send_packets(batch),
+                        timeout=RESULT_SEND_TIMEOUT,
+                    )
+                except asyncio.TimeoutError:
+                    logging.error(
+                        "Timed out sending %d result packets", len(batch)
+                    )
+                except Exception:
+                    logging.exception(
+                        "Failed to send %d result packets", len(batch)
+                    )
+
+        finally:
+            # A later result must always be able to start a new flusher
+            self._flusher = None
+
     # ------------------------- ENGINE RUNNER --------------------------------
 
     async def _run_engine(
@@ -333,14 +488,16 @@ class TaskManager:
         task_info: TaskInfo,
         pipeline: str,
         variables: typing.Optional[str] = None,
-    ):
-        start_time = time.perf_counter()
+    ) -> None:
+        start_ns = time.perf_counter_ns()
 
         try:
-            logging.info(f"Running engine: [{task_info.cookie}] [{pipeline}]")
+            logging.info(
+                "Running engine: [%s] [%s]", task_info.cookie, pipeline
+            )
 
             # Process the variables
-            v = json.loads(variables) if variables else {}
+            v = orjson.loads(variables) if variables else {}
             vobj = Variables(v)
 
             # Run the engine
@@ -350,14 +507,20 @@ class TaskManager:
             )
 
             # Serialize the results
-            rc_str = json.dumps(rc) if rc else None
-
-            await self._transport.send_packet(
-                SocketPacket(
-                    packet_type=PacketType.RESULT,
-                    cookie=task_info.cookie,
-                    rc=ResultCode.OK,
-                    result=rc_str,
+            if not rc:
+                rc_str = None
+            elif _exceeds_size(rc, OFFLOAD_THRESHOLD):
+                rc_str = await asyncio.to_thread(_dumps, rc)
+            else:
+                rc_str = _dumps(rc)
+
+            self._queue_result(
+                self._RESULT_TEMPLATE.model_copy(
+                    update={
+                        "cookie": task_info.cookie,
+                        "rc": ResultCode.OK,
+                        "result": rc_str,
+                    }
                 )
             )
 
@@ -371,14 +534,14 @@ class TaskManager:
 
             st = stack.as_list()
 
-            await self._transport.send_packet(
-                SocketPacket(
-                    packet_type=PacketType.RESULT,
-                    cookie=task_info.cookie,
-                    rc=ResultCode.PROCESSOR_EXCEPTION,
-                    error=str(ex),
-                    stacktrace=st,
-                    result=None,
+            self._queue_result(
+                self._RESULT_TEMPLATE.model_copy(
+                    update={
+                        "cookie": task_info.cookie,
+                        "rc": ResultCode.PROCESSOR_EXCEPTION,
+                        "error": str(ex),
+                        "stacktrace": st,
+                    }
                 )
             )
 
@@ -387,24 +550,28 @@ class TaskManager:
                 f"Exception occurred during engine run: [{task_info.cookie}] [{pipeline}]"
             )
 
-            await self._transport.send_packet(
-                SocketPacket(
-                    packet_type=PacketType.RESULT,
-                    cookie=task_info.cookie,
-                    rc=ResultCode.EXCEPTION,
-                    error=str(e),
-                    stacktrace=traceback.format_exception(e),
-                    result=None,
+            # Formatting deep stacks is slow; keep those off the event loop
+            if not self._include_stacktrace:
+                st = None
+            elif _tb_depth(e) > TRACEBACK_OFFLOAD_DEPTH:
+                st = await asyncio.to_thread(traceback.format_exception, e)
+            else:
+                st = traceback.format_exception(e)
+
+            self._queue_result(
+                self._RESULT_TEMPLATE.model_copy(
+                    update={
+                        "cookie": task_info.cookie,
+                        "rc": ResultCode.EXCEPTION,
+                        "error": str(e),
+                        "stacktrace": st,
+                    }
                 )
             )
 
-        end_time = time.perf_counter()
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            elapsed_ns = time.perf_counter_ns() - start_ns
 
-        elapsed = (end_time - start_time) * 1_000_000
-
-        time_ms = elapsed / 1_000
-        time_s = time_ms / 1_000
-
-        logging.info(
-            f"Engine task completed: [{task_info.cookie}] [{pipeline}] [{elapsed:.2f}us] [{time_ms:.2f}ms] [{time_s:.2f}s]"
-        )
+            logging.info(
+                f"Engine task completed: [{task_info.cookie}] [{pipeline}] [{elapsed_ns / 1_000:.2f}us] [{elapsed_ns / 1_000_000:.2f}ms] [{elapsed_ns / 1_000_000_000:.2f}s]"
+            )
@@ -4,6 +4,13 @@ import typing
 import asyncio
 import uuid
 
+try:
+    import uvloop
+
+    run_async = uvloop.run
+except ImportError:
+    run_async = asyncio.run
+
 from reasonchip.persistence.restful.restful import Restful
 from reasonchip.persistence.restful.models import (
     DynamicModel,
@@ -13,7 +20,6 @@ from reasonchip.persistence.restful.models import (
 
 from auth.django_restful_token import DjangoRestfulTokenAuth
 
-
 # *************************** MODELS *****************************************
 
 
@@ -79,33 +85,22 @@ async def main():
 
     async with restful as rf:
 
-        # Countries
-        countries = rf.objects.country
-        rc = await countries.filter()
-        if not rc:
-            print("No countries found...")
-        else:
-            for c in rc:
-                print(c)
-
-        # Country Shapes
-        shapes = rf.objects.country_shape
-        rc = await shapes.filter()
-        if not rc:
-            print("No country shapes found...")
-        else:
-            for c in rc:
-                print(c)
-
-        # Country Relationship
-        relationships = rf.objects.country_relationship
-        rc = await relationships.filter()
-        if not rc:
-            print("No country relationships found...")
-        else:
-            for c in rc:
-                print(c)
+        listings = [
+            ("countries", rf.objects.country),
+            ("country shapes", rf.objects.country_shape),
+            ("country relationships", rf.objects.country_relationship),
+        ]
+
+        # The listings are independent requests, so fetch them together
+        results = await asyncio.gather(*[om.filter() for _, om in listings])
+
+        for (label, _), rc in zip(listings, results):
+            if not rc:
+                print(f"No {label} found...")
+            else:
+                for c in rc:
+                    print(c)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_async(main())
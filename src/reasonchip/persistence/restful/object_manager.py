@@ -1,6 +1,8 @@
 import uuid
 import typing
 import httpx
+import asyncio
+import functools
 
 from pydantic import BaseModel, Field
 
@@ -8,7 +10,6 @@ from .models import RestfulModel
 from .auth.auth_handler import AuthHandler
 from .query import Query
 
-
 RRT = typing.TypeVar("RRT", bound=BaseModel)
 
 
@@ -19,6 +20,16 @@ class RestfulResult(BaseModel, typing.Generic[RRT]):
     results: typing.List[RRT] = Field(default_factory=list)
 
 
+@functools.cache
+def page_model(
+    model: typing.Type[RestfulModel],
+) -> typing.Type[RestfulResult]:
+    # Parametrize and build the page schema once per model
+    m = RestfulResult[model]
+    m.model_rebuild()
+    return m
+
+
 class ObjectManager:
 
     def __init__(
@@ -31,6 +42,9 @@ class ObjectManager:
         self._model: typing.Type[RestfulModel] = model
         self._auth: typing.Optional[AuthHandler] = auth
 
+        # Endpoint prefix is fixed for the model
+        self._endpoint: str = model._endpoint.strip("/") + "/"
+
     # ---------------------------- LISTING -----------------------------------
 
     async def filter(
@@ -38,28 +52,75 @@ class ObjectManager:
         query: typing.Optional[Query] = None,
     ) -> typing.Optional[RestfulResult]:
 
+        params = query.to_params() if query else {}
+        return await self._get_page(self._endpoint, params)
+
+    async def pages(
+        self,
+        query: typing.Optional[Query] = None,
+        prefetch: int = 2,
+    ) -> typing.AsyncIterator[RestfulResult]:
+
+        # Pages are fetched in the background, following the "next" links,
+        # while the caller works through the ones already received.
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, prefetch))
+
+        async def fetch():
+            try:
+                url = self._endpoint
+                params = query.to_params() if query else {}
+
+                while url:
+                    page = await self._get_page(url, params)
+                    if page is None:
+                        break
+
+                    await queue.put(page)
+
+                    # The next link already carries the query
+                    url, params = page.next, None
+
+                await queue.put(None)
+
+            except Exception as e:
+                await queue.put(e)
+
+        task = asyncio.create_task(fetch())
+
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+
+                if isinstance(item, Exception):
+                    raise item
+
+                yield item
+
+        finally:
+            task.cancel()
+
+    async def _get_page(
+        self,
+        url: str,
+        params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+    ) -> typing.Optional[RestfulResult]:
+
         mod = self._model
-        endpoint = mod._endpoint.strip("/") + "/"
 
         if self._auth:
             await self._auth.on_request(self._session)
 
-        params = query.to_params() if query else {}
-
-        resp = await self._session.get(endpoint, params=params)
+        resp = await self._session.get(url, params=params)
 
         if resp.status_code == 200:
-            rc = resp.json()
-            from pprint import pprint
-
-            pprint(rc)
-
-            RestfulPageModel = RestfulResult[mod]
-            return RestfulPageModel.model_validate(rc)
+            RestfulPageModel = page_model(mod)
+            return RestfulPageModel.model_validate_json(resp.content)
 
         if resp.status_code == 401 and self._auth:
             await self._auth.on_forbidden(self._session)
-            return await self.filter(query=query)
+            return await self._get_page(url, params)
 
         if resp.status_code == 404:
             return None
@@ -76,7 +137,7 @@ class ObjectManager:
     ) -> typing.Optional[RestfulModel]:
 
         mod = self._model
-        endpoint = mod._endpoint.strip("/") + "/"
+        endpoint = self._endpoint
 
         # Authentication
         if self._auth:
@@ -87,7 +148,7 @@ class ObjectManager:
         resp = await self._session.post(endpoint, json=payload)
 
         if resp.status_code == 201:
-            return mod.model_validate(resp.json())
+            return mod.model_validate_json(resp.content)
 
         if resp.status_code == 401 and self._auth:
             await self._auth.on_forbidden(self._session)
@@ -103,7 +164,7 @@ class ObjectManager:
     ) -> typing.Optional[RestfulModel]:
 
         mod = self._model
-        endpoint = mod._endpoint.strip("/") + f"/{oid}/"
+        endpoint = f"{self._endpoint}{oid}/"
 
         # Authentication
         if self._auth:
@@ -114,7 +175,7 @@ class ObjectManager:
 
         # Successful retrieval
         if resp.status_code == 200:
-            rc = mod.model_validate(resp.json())
+            rc = mod.model_validate_json(resp.content)
             return rc
 
         # Handle authentication errors
@@ -137,7 +198,7 @@ class ObjectManager:
     ) -> typing.Optional[RestfulModel]:
 
         mod = self._model
-        endpoint = mod._endpoint.strip("/") + f"/{oid}/"
+        endpoint = f"{self._endpoint}{oid}/"
 
         # Authentication
         if self._auth:
@@ -148,7 +209,7 @@ class ObjectManager:
         resp = await self._session.put(endpoint, json=payload)
 
         if resp.status_code == 200:
-            return mod.model_validate(resp.json())
+            return mod.model_validate_json(resp.content)
 
         if resp.status_code == 401 and self._auth:
             await self._auth.on_forbidden(self._session)
@@ -164,7 +225,7 @@ class ObjectManager:
     ) -> bool:
 
         mod = self._model
-        endpoint = mod._endpoint.strip("/") + f"/{oid}/"
+        endpoint = f"{self._endpoint}{oid}/"
 
         # Authentication
         if self._auth:
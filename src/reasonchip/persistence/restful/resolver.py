@@ -1,6 +1,9 @@
 import typing
 import httpx
+import orjson
 import asyncio
+import hashlib
+import logging
 
 from dataclasses import dataclass
 
@@ -18,6 +21,21 @@ from .models import (
     Relationship,
 )
 
+# Simple OPTIONS field types and the python types they map onto
+_TYPE_MAP: typing.Dict[str, typing.Any] = {
+    "string": str,
+    "boolean": bool,
+    "datetime": datetime,
+    "choice": str,
+}
+
+
+# Upper bound on concurrent OPTIONS requests made by Resolver.init
+INSPECT_CONCURRENCY: int = 8
+
+# Generated models shared across resolvers: (model, schema digest, refs)
+_SCHEMA_MODELS: typing.Dict[typing.Tuple, typing.Type[BaseModel]] = {}
+
 
 @dataclass
 class ModelInfo:
@@ -31,8 +49,8 @@ class Resolver:
         self,
         models: typing.List[typing.Type[RestfulModel]],
     ):
-        self._lock: asyncio.Lock = asyncio.Lock()
         self._registry: typing.Dict[str, ModelInfo] = {}
+        self._locks: typing.Dict[str, asyncio.Lock] = {}
 
         for x in models:
             field_name = x._field_name if x._field_name else x._endpoint
@@ -40,6 +58,7 @@ class Resolver:
                 field_name not in self._registry
             ), f"Model '{field_name}' already exists in registry."
             self._registry[field_name] = ModelInfo(model=x)
+            self._locks[field_name] = asyncio.Lock()
 
     @property
     def models(self) -> typing.Dict[str, typing.Type[RestfulModel]]:
@@ -58,12 +77,18 @@ class Resolver:
         session: httpx.AsyncClient,
         auth: typing.Optional[AuthHandler] = None,
     ):
-        for k, _ in self._registry.items():
-            im: typing.Type[BaseModel] = await self._inspect(
-                session,
-                field_name=k,
-                auth=auth,
-            )
+        # Inspections are independent round trips, so overlap them
+        sem = asyncio.Semaphore(INSPECT_CONCURRENCY)
+
+        async def inspect(field_name: str) -> typing.Type[BaseModel]:
+            async with sem:
+                return await self._inspect(
+                    session,
+                    field_name=field_name,
+                    auth=auth,
+                )
+
+        await asyncio.gather(*[inspect(k) for k in self._registry])
 
     def get_model(self, field_name: str):
         assert (
@@ -85,13 +110,17 @@ class Resolver:
         auth: typing.Optional[AuthHandler] = None,
     ) -> typing.Type[BaseModel]:
 
-        async with self._lock:
+        # Check for local cache
+        if field_name not in self._registry:
+            raise RuntimeError(f"Model '{field_name}' not found in registry.")
 
-            # Check for local cache
-            if field_name not in self._registry:
-                raise RuntimeError(
-                    f"Model '{field_name}' not found in registry."
-                )
+        # Already inspected, nothing to wait for
+        entry = self._registry[field_name]
+        if entry.inspected_model:
+            return entry.inspected_model
+
+        # Only inspections of the same model wait on each other
+        async with self._locks[field_name]:
 
             # Check if already inspected
             entry = self._registry[field_name]
@@ -108,21 +137,23 @@ class Resolver:
 
             endpoint = model._endpoint.strip("/") + "/"
 
-            # Authentication
-            if auth:
-                await auth.on_request(session)
-
-            # Perform request
-            resp = await session.options(endpoint)
-            if resp.status_code != 200:
+            while True:
+                # Authentication
+                if auth:
+                    await auth.on_request(session)
 
+                # Perform request
+                resp = await session.options(endpoint)
                 if resp.status_code == 401 and auth:
                     await auth.on_forbidden(session)
-                    return await self._inspect(session, field_name, auth)
+                    continue
+
+                break
 
+            if resp.status_code != 200:
                 raise RuntimeError("Unable to fetch OPTIONS")
 
-            rc = resp.json()
+            rc = orjson.loads(resp.content)
 
             post_schema = rc["actions"]["POST"]
             model_name = model.__name__
@@ -152,6 +183,36 @@ class Resolver:
         model_name: str,
     ) -> typing.Type[BaseModel]:
 
+        # The same schema for the same model always builds the same class
+        digest = hashlib.blake2b(
+            orjson.dumps(schema, option=orjson.OPT_SORT_KEYS),
+            digest_size=16,
+        ).digest()
+
+        refs = tuple(
+            (k, self._registry[k].model)
+            for k, meta in schema.items()
+            if meta.get("type") == "field" and k in self._registry
+        )
+
+        key = (model, model_name, digest, refs)
+
+        m = _SCHEMA_MODELS.get(key)
+        if m is None:
+            m = _SCHEMA_MODELS[key] = self._build_model_from_schema(
+                model=model,
+                schema=schema,
+                model_name=model_name,
+            )
+        return m
+
+    def _build_model_from_schema(
+        self,
+        model: typing.Type[RestfulModel],
+        schema: typing.Dict[str, typing.Any],
+        model_name: str,
+    ) -> typing.Type[BaseModel]:
+
         # Original fields take precedence over # generated fields
         original_fields = model.model_fields
 
@@ -201,23 +262,16 @@ class Resolver:
 
             field_type = meta["type"]
 
-            if field_type == "string":
-                field_type = str
-
-            elif field_type == "boolean":
-                field_type = bool
-
-            elif field_type == "datetime":
-                field_type = datetime
-
-            elif field_type == "choice":
-                field_type = str
+            if field_type in _TYPE_MAP:
+                field_type = _TYPE_MAP[field_type]
 
             elif field_type == "field":
                 if field_name not in self._registry:
-                    print(f"========= BEGIN: SCHEMA ============")
-                    print(schema)
-                    print(f"========= END: SCHEMA ==============")
+                    logging.error(
+                        "Unresolved schema for model '%s': %s",
+                        model_name,
+                        schema,
+                    )
                     assert (
                         False
                     ), f"Field type '{field_name}' not found in registry in model '{model_name}'"
@@ -226,9 +280,11 @@ class Resolver:
                 field_type = mi.model
 
             else:
-                print(f"========= BEGIN: SCHEMA ============")
-                print(schema)
-                print(f"========= END: SCHEMA ==============")
+                logging.error(
+                    "Unresolved schema for model '%s': %s",
+                    model_name,
+                    schema,
+                )
                 assert (
                     False
                 ), f"Unsupported field type '{field_type}' for field '{field_name}' in model '{model_name}'"
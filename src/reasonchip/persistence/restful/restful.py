@@ -24,6 +24,13 @@ class Restful:
         if "follow_redirects" not in p:
             p["follow_redirects"] = True
 
+        # Keep enough idle connections around for concurrent fan-out
+        if "limits" not in p:
+            p["limits"] = httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=50,
+            )
+
         self._session = httpx.AsyncClient(**p)
 
     async def __aenter__(self):
@@ -5,12 +5,13 @@ from .auth.auth_handler import AuthHandler
 from .resolver import Resolver
 from .object_manager import ObjectManager
 
-
 # -------------------- OBJECT PROXY ------------------------------------------
 
 
 class ObjectProxy:
 
+    __slots__ = ("_session", "_resolver", "_auth", "_managers")
+
     def __init__(
         self,
         session: httpx.AsyncClient,
@@ -20,6 +21,7 @@ class ObjectProxy:
         self._session: httpx.AsyncClient = session
         self._resolver: Resolver = resolver
         self._auth: typing.Optional[AuthHandler] = auth
+        self._managers: typing.Dict[str, ObjectManager] = {}
 
     def __getattr__(self, name: str) -> ObjectManager:
         if name.startswith("_"):
@@ -27,12 +29,15 @@ class ObjectProxy:
                 f"'{self.__class__.__name__}' object has no attribute '{name}'"
             )
 
-        model = self._resolver.get_model(name)
-        objman = ObjectManager(
-            session=self._session,
-            model=model,
-            auth=self._auth,
-        )
+        # Managers hold no per-call state, so one per model is enough
+        objman = self._managers.get(name)
+        if objman is None:
+            model = self._resolver.get_model(name)
+            objman = self._managers[name] = ObjectManager(
+                session=self._session,
+                model=model,
+                auth=self._auth,
+            )
         return objman
 
 
@@ -41,6 +46,8 @@ class ObjectProxy:
 
 class RestfulSession:
 
+    __slots__ = ("_session", "_resolver", "_auth", "_objects")
+
     def __init__(
         self,
         session: httpx.AsyncClient,
@@ -5,6 +5,7 @@ import asyncio
 import datetime
 
 from reasonchip.persistence.rox.models import RoxModel, Field
+from reasonchip.persistence.rox.manager import RoxManager
 from reasonchip.persistence.rox.rox import Rox, RoxConfiguration
 
 
@@ -36,7 +37,9 @@ class Person(SammyModel):
 async def main():
     config: RoxConfiguration = RoxConfiguration()
 
-    Rox(config)
+    rox = Rox(config)
+    await rox.warmup()
+    await RoxManager.get_instance().preload(["sammy"])
 
     person = Person(
         first_name="John",
@@ -3,13 +3,15 @@ from __future__ import annotations
 import typing
 import uuid
 import asyncio
-import json
+import functools
 
+import orjson
 import diff_match_patch as dmp_module
 
 import sqlalchemy as sa
 
 from sqlalchemy.schema import CreateSchema
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     AsyncConnection,
@@ -17,10 +19,9 @@ from sqlalchemy.ext.asyncio import (
 
 from dataclasses import dataclass
 
-from .rox import Rox
+from .rox import Rox, json_serializer
 from .utils import pascal_to_snake
 
-
 ResultType = typing.Optional[
     typing.Tuple[int, int, typing.Dict[str, typing.Any]]
 ]
@@ -30,19 +31,199 @@ UpdateCallbackType = typing.Callable[
 ]
 
 
-def custom_json_serializer(obj):
-    if isinstance(obj, uuid.UUID):
-        return str(obj)
+def loads_model(value: typing.Any) -> typing.Dict[str, typing.Any]:
+    # Rows written before the model column took dicts hold a JSON string
+    if isinstance(value, str):
+        return orjson.loads(value)
+    return value
+
+
+# Shared, typed so the statements compile once and hit the cache
+OID_PARAM = sa.bindparam("oid", type_=sa.UUID)
+
+
+@dataclass(frozen=True)
+class ModelStatements:
+    select: sa.Select
+    select_many: sa.Select
+    insert: sa.Insert
+    update: sa.Update
+    delete: sa.Delete
+
+
+@dataclass(frozen=True)
+class EntityStatements:
+    insert: sa.Insert
+    touch: sa.Update
+    delete: sa.Delete
+
+
+@functools.lru_cache(maxsize=512)
+def model_statements(tbl: sa.Table) -> ModelStatements:
+    select = sa.select(
+        tbl.c.version,
+        tbl.c.revision,
+        tbl.c.model,
+    ).where(tbl.c.id == OID_PARAM)
+
+    select_many = sa.select(
+        tbl.c.id,
+        tbl.c.version,
+        tbl.c.revision,
+        tbl.c.model,
+    ).where(tbl.c.id.in_(sa.bindparam("oids", expanding=True)))
+
+    return ModelStatements(
+        select=select,
+        select_many=select_many,
+        insert=sa.insert(tbl),
+        update=sa.update(tbl).where(
+            tbl.c.id == OID_PARAM,
+            tbl.c.revision
+            == sa.bindparam("expected_revision", type_=sa.BigInteger),
+        ),
+        delete=sa.delete(tbl).where(tbl.c.id == OID_PARAM),
+    )
+
+
+@functools.lru_cache(maxsize=512)
+def entity_statements(tbl: sa.Table) -> EntityStatements:
+    return EntityStatements(
+        insert=sa.insert(tbl),
+        touch=(
+            sa.update(tbl)
+            .where(tbl.c.id == OID_PARAM)
+            .values(last_updated_at=sa.func.now())
+        ),
+        delete=sa.delete(tbl).where(tbl.c.id == OID_PARAM),
+    )
+
+
+# Dialects with INSERT ... ON CONFLICT DO UPDATE
+_UPSERT_INSERTS: typing.Dict[str, typing.Callable[[sa.Table], typing.Any]] = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+@functools.lru_cache(maxsize=512)
+def entity_upsert_statement(
+    tbl: sa.Table,
+    dialect_name: str,
+) -> typing.Optional[sa.Insert]:
+    insert = _UPSERT_INSERTS.get(dialect_name)
+    if insert is None:
+        return None
+
+    stmt = insert(tbl)
+    return stmt.on_conflict_do_update(
+        index_elements=[tbl.c.id],
+        set_={"last_updated_at": sa.func.now()},
+    )
+
+
+@functools.lru_cache(maxsize=512)
+def association_delete_statement(tbl: sa.Table) -> sa.Delete:
+    return sa.delete(tbl).where(tbl.c.parent_id == OID_PARAM)
+
+
+@functools.lru_cache(maxsize=512)
+def fused_create_statement(
+    tbl: sa.Table,
+    entity_tbl: sa.Table,
+    changelog_tbl: typing.Optional[sa.Table],
+) -> sa.Executable:
+    """
+    Insert the model row, its entity row and optionally its changelog row
+    in one statement by chaining data-modifying CTEs. PostgreSQL only.
+    """
+    ins = (
+        sa.insert(tbl)
+        .values(
+            id=sa.bindparam("p_oid", type_=sa.UUID),
+            version=sa.bindparam("p_version", type_=sa.Integer),
+            revision=sa.bindparam("p_revision", type_=sa.BigInteger),
+            model=sa.bindparam("p_model", type_=tbl.c.model.type),
+        )
+        .returning(tbl.c.id)
+        .cte("ins")
+    )
+
+    reg = (
+        sa.insert(entity_tbl)
+        .from_select(
+            ["id", "model_name"],
+            sa.select(
+                ins.c.id,
+                sa.bindparam("p_model_name", type_=sa.String),
+            ),
+        )
+        .returning(entity_tbl.c.id)
+        .cte("reg")
+    )
+
+    if changelog_tbl is None:
+        return sa.select(reg.c.id)
+
+    return (
+        sa.insert(changelog_tbl)
+        .from_select(
+            ["oid", "version", "revision", "patch_up", "patch_down"],
+            sa.select(
+                reg.c.id,
+                sa.bindparam("p_version", type_=sa.Integer),
+                sa.bindparam("p_revision", type_=sa.BigInteger),
+                sa.bindparam("p_patch_up", type_=sa.Text),
+                sa.bindparam("p_patch_down", type_=sa.Text),
+            ),
+        )
+        .returning(changelog_tbl.c.oid)
+    )
+
+
+def changelog_dumps(obj: typing.Any) -> str:
+    # JSONB does not keep key order, so changelog text is sorted on both
+    # sides of a diff to keep consecutive patches chaining.
+    return orjson.dumps(
+        obj,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS,
+    ).decode()
+
+
+# Only tunables live on the instance, so it is safe to share across threads
+_dmp = dmp_module.diff_match_patch()
 
-    raise TypeError(f"Type {type(obj)} not serializable")
 
+def changelog_patches(old_json: str, new_json: str) -> typing.Tuple[str, str]:
+    # Upwards. A fresh object has nothing to diff against.
+    if old_json:
+        diffs_up = _dmp.diff_main(old_json, new_json)
+        _dmp.diff_cleanupSemantic(diffs_up)
+    else:
+        diffs_up = [(_dmp.DIFF_INSERT, new_json)] if new_json else []
 
-@dataclass
+    # Downwards is the same diff with inserts and deletes swapped
+    diffs_down = [(-op, text) for op, text in diffs_up]
+
+    patches_up = _dmp.patch_make(old_json, diffs_up)
+    patches_down = _dmp.patch_make(new_json, diffs_down)
+
+    return _dmp.patch_toText(patches_up), _dmp.patch_toText(patches_down)
+
+
+@dataclass(slots=True, frozen=True)
 class RoxAssociation:
     child_schema: str
     child_id: uuid.UUID
 
 
+_EMPTY: typing.Dict[str, sa.Table] = {}
+
+UPDATE_ATTEMPTS = 3
+
+# Diffs over more text than this are computed off the event loop
+DIFF_OFFLOAD_THRESHOLD = 8192
+
 ROX_ENTITY = "rox_entity"
 ROX_CHANGELOG = "rox_changelog"
 ROX_ASSOCIATION = "rox_association"
@@ -50,26 +231,13 @@ ROX_ASSOCIATION = "rox_association"
 
 class RoxManager:
 
-    _instance: typing.Optional[RoxManager] = None
-    _initialized: bool = False
-
     # ------------------------ CONSTRUCTORS ----------------------------------
 
-    def __new__(cls, *args, **kwargs):
-        if not cls._instance:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-
     def __init__(self):
-        if self._initialized:
-            return
-
-        self._lock: asyncio.Lock = asyncio.Lock()
+        self._schema_locks: typing.Dict[str, asyncio.Lock] = {}
         self._seen: typing.Dict[str, typing.Dict[str, sa.sa.Table]] = {}
         self._rox: typing.Optional[Rox] = None
 
-        self._initialized = True
-
     # ------------------------ PROPERTIES ------------------------------------
 
     @property
@@ -81,10 +249,9 @@ class RoxManager:
     # ------------------------ SUPPORT ---------------------------------------
 
     @classmethod
+    @functools.cache
     def get_instance(cls) -> RoxManager:
-        if not cls._instance:
-            return cls()
-        return cls._instance
+        return cls()
 
     # ------------------------ CRUD ------------------------------------------
 
@@ -99,18 +266,33 @@ class RoxManager:
         obj: typing.Dict[str, typing.Any],
         changelog: bool,
     ):
-        json_str = json.dumps(obj, default=custom_json_serializer)
-
         tbl = await self._fetch_table(session, schema, model_name)
-        stmt = sa.insert(tbl).values(
-            id=oid,
-            version=version,
-            revision=revision,
-            model=json_str,
-        )
+
+        # One round trip where the database supports it
+        if session.get_bind().dialect.name == "postgresql":
+            await self._fused_create(
+                session,
+                tbl,
+                model_name,
+                schema,
+                oid,
+                version,
+                revision,
+                obj,
+                changelog,
+            )
+            return
 
         # Create the entity
-        result = await session.execute(stmt)
+        result = await session.execute(
+            model_statements(tbl).insert,
+            {
+                "id": oid,
+                "version": version,
+                "revision": revision,
+                "model": obj,
+            },
+        )
         if result.rowcount != 1:
             raise RuntimeError(
                 f"Failed to insert object {obj} into table {tbl.name}"
@@ -133,13 +315,141 @@ class RoxManager:
             version,
             revision,
             "",
-            json_str,
+            changelog_dumps(obj),
         )
         if not success:
             raise RuntimeError(
                 f"Failed to create changelog entry for {oid} into table {tbl.name}"
             )
 
+    async def _fused_create(
+        self,
+        session: AsyncSession,
+        tbl: sa.Table,
+        model_name: str,
+        schema: str,
+        oid: uuid.UUID,
+        version: int,
+        revision: int,
+        obj: typing.Dict[str, typing.Any],
+        changelog: bool,
+    ):
+        entity_tbl = await self._fetch_table(session, schema, ROX_ENTITY)
+
+        params: typing.Dict[str, typing.Any] = {
+            "p_oid": oid,
+            "p_version": version,
+            "p_revision": revision,
+            "p_model": obj,
+            "p_model_name": model_name,
+        }
+
+        changelog_tbl = None
+        if changelog:
+            changelog_tbl = await self._fetch_table(
+                session, schema, ROX_CHANGELOG
+            )
+
+            patch_up, patch_down = changelog_patches("", changelog_dumps(obj))
+            params["p_patch_up"] = patch_up
+            params["p_patch_down"] = patch_down
+
+        stmt = fused_create_statement(tbl, entity_tbl, changelog_tbl)
+
+        result = await session.execute(stmt, params)
+        if result.first() is None:
+            raise RuntimeError(
+                f"Failed to create object {oid} into table {tbl.name}"
+            )
+
+    async def bulk_create(
+        self,
+        session: AsyncSession,
+        schema: str,
+        model_name: str,
+        rows: typing.List[
+            typing.Tuple[uuid.UUID, int, int, typing.Dict[str, typing.Any]]
+        ],
+        changelog: bool,
+    ):
+        """
+        Create many objects of one model at once. Rows are tuples of
+        (oid, version, revision, obj). PostgreSQL uses the COPY protocol,
+        other databases fall back to executemany.
+        """
+        if not rows:
+            return
+
+        tbl = await self._fetch_table(session, schema, model_name)
+        entity_tbl = await self._fetch_table(session, schema, ROX_ENTITY)
+
+        await self._bulk_insert(
+            session,
+            tbl,
+            ["id", "version", "revision", "model"],
+            [(oid, v, r, obj) for oid, v, r, obj in rows],
+        )
+
+        await self._bulk_insert(
+            session,
+            entity_tbl,
+            ["id", "model_name"],
+            [(oid, model_name) for oid, _, _, _ in rows],
+        )
+
+        if not changelog:
+            return
+
+        changelog_tbl = await self._fetch_table(session, schema, ROX_CHANGELOG)
+
+        records = []
+        for oid, v, r, obj in rows:
+            patch_up, patch_down = changelog_patches("", changelog_dumps(obj))
+            records.append((oid, v, r, patch_up, patch_down))
+
+        await self._bulk_insert(
+            session,
+            changelog_tbl,
+            ["oid", "version", "revision", "patch_up", "patch_down"],
+            records,
+        )
+
+    async def _bulk_insert(
+        self,
+        session: AsyncSession,
+        tbl: sa.Table,
+        columns: typing.List[str],
+        records: typing.List[typing.Tuple[typing.Any, ...]],
+    ):
+        conn = await session.connection()
+
+        if conn.dialect.driver == "asyncpg":
+            # COPY bypasses the JSON type processors, so encode by hand
+            json_cols = [
+                i
+                for i, c in enumerate(columns)
+                if isinstance(tbl.c[c].type, sa.JSON)
+            ]
+            if json_cols:
+                records = [list(rec) for rec in records]
+                for rec in records:
+                    for i in json_cols:
+                        rec[i] = json_serializer(rec[i])
+
+            raw = await conn.get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(
+                tbl.name,
+                records=records,
+                columns=columns,
+                schema_name=tbl.schema,
+            )
+            return
+
+        await session.execute(
+            sa.insert(tbl),
+            [dict(zip(columns, rec)) for rec in records],
+        )
+
     async def load(
         self,
         session: AsyncSession,
@@ -150,21 +460,38 @@ class RoxManager:
 
         tbl = await self._fetch_table(session, schema, model_name)
 
-        stmt = sa.select(
-            tbl.c.version,
-            tbl.c.revision,
-            tbl.c.model,
-        ).where(tbl.c.id == oid)
-
-        result = await session.execute(stmt)
-        row = result.first()
-        if not row:
+        result = await session.execute(
+            model_statements(tbl).select,
+            {"oid": oid},
+        )
+        row = result.one_or_none()
+        if row is None:
             return None
 
-        version = row[0]
-        revision = row[1]
-        json_str = row[2]
-        return version, revision, json.loads(json_str)
+        version, revision, model = row
+        return version, revision, loads_model(model)
+
+    async def load_many(
+        self,
+        session: AsyncSession,
+        schema: str,
+        model_name: str,
+        oids: typing.Collection[uuid.UUID],
+    ) -> typing.Dict[
+        uuid.UUID, typing.Tuple[int, int, typing.Dict[str, typing.Any]]
+    ]:
+
+        tbl = await self._fetch_table(session, schema, model_name)
+
+        result = await session.execute(
+            model_statements(tbl).select_many,
+            {"oids": list(oids)},
+        )
+
+        return {
+            oid: (version, revision, loads_model(model))
+            for oid, version, revision, model in result
+        }
 
     async def update(
         self,
@@ -179,89 +506,85 @@ class RoxManager:
 
         # Get the entity from the database
         tbl = await self._fetch_table(session, schema, model_name)
+        stmts = model_statements(tbl)
 
-        stmt = (
-            sa.select(
-                tbl.c.version,
-                tbl.c.revision,
-                tbl.c.model,
-            )
-            .where(tbl.c.id == oid)
-            .with_for_update()
-        )
+        # Optimistic concurrency. The row is read without a lock and the
+        # update only applies if the revision is still the one we read.
+        for _ in range(UPDATE_ATTEMPTS):
+            result = await session.execute(stmts.select, {"oid": oid})
 
-        result = await session.execute(stmt)
+            row = result.one_or_none()
 
-        row = result.first()
+            if row is None:
+                params = None
+                model = None
+            else:
+                version, revision, model = row
+                params = (version, revision, loads_model(model))
 
-        if row:
-            old_json_str = row[2]
-            params = (row[0], row[1], json.loads(old_json_str))
-        else:
-            old_json_str = ""
-            params = None
+            # Call the callback to get the new object
+            rc = await callback(params, obj)
+            if not rc:
+                return None
 
-        # Call the callback to get the new object
-        rc = await callback(params, obj)
-        if not rc:
-            return None
+            new_version = rc[0]
+            new_revision = rc[1]
 
-        new_version = rc[0]
-        new_revision = rc[1]
-        json_str = json.dumps(rc[2], default=custom_json_serializer)
-
-        # Update because it already exists
-        if params:
-            stmt = (
-                sa.update(tbl)
-                .where(tbl.c.id == oid)
-                .values(
-                    version=new_version,
-                    revision=new_revision,
-                    model=json_str,
-                )
+            # Create because it doesn't exist
+            if not params:
+                break
+
+            # Update because it already exists
+            result = await session.execute(
+                stmts.update,
+                {
+                    "oid": oid,
+                    "expected_revision": params[1],
+                    "version": new_version,
+                    "revision": new_revision,
+                    "model": rc[2],
+                },
             )
-
-            result = await session.execute(stmt)
-            if result.rowcount != 1:
-                raise RuntimeError(
-                    f"Failed to update object {oid} into table {tbl.name}"
-                )
-
-            # Touch entity
-            if not await self.touch_entity(session, schema, oid):
-                raise RuntimeError(
-                    f"Failed to touch entity {oid} into table {tbl.name}"
-                )
+            if result.rowcount == 1:
+                break
         else:
+            raise RuntimeError(
+                f"Failed to update object {oid} into table {tbl.name}"
+            )
+
+        if not params:
             # Create because it doesn't exist
-            stmt = sa.insert(tbl).values(
-                id=oid,
-                version=new_version,
-                revision=new_revision,
-                model=json_str,
+            result = await session.execute(
+                stmts.insert,
+                {
+                    "id": oid,
+                    "version": new_version,
+                    "revision": new_revision,
+                    "model": rc[2],
+                },
             )
-            result = await session.execute(stmt)
             if result.rowcount != 1:
                 raise RuntimeError(
                     f"Failed to update (via insert) object {oid} into table {tbl.name}"
                 )
 
-            # Register the entity
-            result = await self.register_entity(
-                session,
-                schema,
-                model_name,
-                oid,
+        # Register or touch the entity
+        if not await self.upsert_entity(session, schema, model_name, oid):
+            raise RuntimeError(
+                f"Failed to upsert entity {oid} into table {tbl.name}"
             )
-            if not result:
-                raise RuntimeError(
-                    f"Failed to register entity {oid} into table {tbl.name}"
-                )
 
         if not changelog:
             return rc
 
+        # Legacy rows already hold their text form, so don't re-encode it
+        if isinstance(model, str):
+            old_json = model
+        elif params:
+            old_json = changelog_dumps(params[2])
+        else:
+            old_json = ""
+
         # Record the changelog
         success = await self.create_changelog_entry(
             session,
@@ -269,8 +592,8 @@ class RoxManager:
             oid,
             new_version,
             new_revision,
-            old_json_str,
-            json_str,
+            old_json,
+            changelog_dumps(rc[2]),
         )
         if not success:
             raise RuntimeError(
@@ -279,6 +602,45 @@ class RoxManager:
 
         return rc
 
+    async def update_if_revision(
+        self,
+        session: AsyncSession,
+        schema: str,
+        model_name: str,
+        oid: uuid.UUID,
+        expected_revision: int,
+        version: int,
+        revision: int,
+        obj: typing.Dict[str, typing.Any],
+    ) -> bool:
+        """
+        Update without reading the row first. Only applies if the stored
+        revision is the expected one; returns False otherwise so the caller
+        can fall back to update.
+        """
+        tbl = await self._fetch_table(session, schema, model_name)
+
+        result = await session.execute(
+            model_statements(tbl).update,
+            {
+                "oid": oid,
+                "expected_revision": expected_revision,
+                "version": version,
+                "revision": revision,
+                "model": obj,
+            },
+        )
+        if result.rowcount != 1:
+            return False
+
+        # Touch the entity
+        if not await self.upsert_entity(session, schema, model_name, oid):
+            raise RuntimeError(
+                f"Failed to upsert entity {oid} into table {tbl.name}"
+            )
+
+        return True
+
     async def delete(
         self,
         session: AsyncSession,
@@ -299,8 +661,7 @@ class RoxManager:
         # Seems we're okay. Delete the object.
         tbl = await self._fetch_table(session, schema, model_name)
 
-        stmt = sa.delete(tbl).where(tbl.c.id == oid)
-        await session.execute(stmt)
+        await session.execute(model_statements(tbl).delete, {"oid": oid})
 
         # It doesn't matter if the actual object didn't exist. It matters
         # that it's been deregistered as an entity.
@@ -318,31 +679,49 @@ class RoxManager:
 
         tbl = await self._fetch_table(session, schema, ROX_ENTITY)
 
-        stmt = sa.insert(tbl).values(
-            id=oid,
-            model_name=model_name,
+        result = await session.execute(
+            entity_statements(tbl).insert,
+            {"id": oid, "model_name": model_name},
         )
-        result = await session.execute(stmt)
         return result.rowcount == 1
 
-    async def touch_entity(
+    async def upsert_entity(
         self,
         session: AsyncSession,
         schema: str,
+        model_name: str,
         oid: uuid.UUID,
     ) -> bool:
 
         tbl = await self._fetch_table(session, schema, ROX_ENTITY)
 
-        stmt = (
-            sa.update(tbl)
-            .where(tbl.c.id == oid)
-            .values(
-                last_updated_at=sa.func.now(),
-            )
+        stmt = entity_upsert_statement(tbl, session.get_bind().dialect.name)
+
+        # No native upsert, so touch and register if it wasn't there
+        if stmt is None:
+            if await self.touch_entity(session, schema, oid):
+                return True
+            return await self.register_entity(session, schema, model_name, oid)
+
+        result = await session.execute(
+            stmt,
+            {"id": oid, "model_name": model_name},
         )
+        return result.rowcount == 1
 
-        result = await session.execute(stmt)
+    async def touch_entity(
+        self,
+        session: AsyncSession,
+        schema: str,
+        oid: uuid.UUID,
+    ) -> bool:
+
+        tbl = await self._fetch_table(session, schema, ROX_ENTITY)
+
+        result = await session.execute(
+            entity_statements(tbl).touch,
+            {"oid": oid},
+        )
         return result.rowcount == 1
 
     async def deregister_entity(
@@ -354,8 +733,10 @@ class RoxManager:
 
         tbl = await self._fetch_table(session, schema, ROX_ENTITY)
 
-        stmt = sa.delete(tbl).where(tbl.c.id == oid)
-        result = await session.execute(stmt)
+        result = await session.execute(
+            entity_statements(tbl).delete,
+            {"oid": oid},
+        )
         return result.rowcount == 1
 
     async def set_entity_associations(
@@ -369,18 +750,21 @@ class RoxManager:
         tbl = await self._fetch_table(session, schema, ROX_ASSOCIATION)
 
         # Delete all existing associations
-        stmt = sa.delete(tbl).where(tbl.c.parent_id == oid)
-        await session.execute(stmt)
-
-        # Create new associations
-        for assoc in associations:
-            stmt = sa.insert(tbl).values(
-                id=uuid.uuid4(),
-                parent_id=oid,
-                child_schema=assoc.child_schema,
-                child_id=assoc.child_id,
+        await session.execute(association_delete_statement(tbl), {"oid": oid})
+
+        # Create new associations in one executemany
+        if associations:
+            await session.execute(
+                sa.insert(tbl),
+                [
+                    {
+                        "parent_id": oid,
+                        "child_schema": assoc.child_schema,
+                        "child_id": assoc.child_id,
+                    }
+                    for assoc in associations
+                ],
             )
-            await session.execute(stmt)
 
         return True
 
@@ -398,26 +782,17 @@ class RoxManager:
     ) -> bool:
 
         # First we generate the patch difference
-        dmp = dmp_module.diff_match_patch()
-
-        # Upwards
-        diffs_up = dmp.diff_main(old_json, new_json)
-        diffs_down = dmp.diff_main(new_json, old_json)
-
-        dmp.diff_cleanupSemantic(diffs_up)
-        dmp.diff_cleanupSemantic(diffs_down)
-
-        patches_up = dmp.patch_make(old_json, diffs_up)
-        patches_down = dmp.patch_make(new_json, diffs_down)
-
-        patch_up = dmp.patch_toText(patches_up)
-        patch_down = dmp.patch_toText(patches_down)
+        if len(old_json) + len(new_json) > DIFF_OFFLOAD_THRESHOLD:
+            patch_up, patch_down = await asyncio.to_thread(
+                changelog_patches, old_json, new_json
+            )
+        else:
+            patch_up, patch_down = changelog_patches(old_json, new_json)
 
         # Now we record it.
         tbl = await self._fetch_table(session, schema, ROX_CHANGELOG)
 
         stmt = sa.insert(tbl).values(
-            id=uuid.uuid4(),
             oid=oid,
             version=version,
             revision=revision,
@@ -430,6 +805,105 @@ class RoxManager:
 
     # ------------------------ SCHEMA CONTROL --------------------------------
 
+    async def preload(self, schemas: typing.Iterable[str]):
+        """
+        Populate the table cache for tables which already exist so that
+        steady state requests never issue DDL probes. Anything missing
+        is still created lazily on first use.
+        """
+        rox = self.rox
+        metadata = rox.metadata
+
+        async with rox.engine.begin() as conn:
+            use_schema = conn.dialect.name != "sqlite"
+
+            for schema in schemas:
+                async with self._schema_lock(schema):
+                    if schema in self._seen:
+                        continue
+
+                    await self._preload_schema(
+                        conn, metadata, schema, use_schema
+                    )
+
+    async def _preload_schema(
+        self,
+        conn: AsyncConnection,
+        metadata: sa.MetaData,
+        schema: str,
+        use_schema: bool,
+    ):
+        names = set(
+            await conn.run_sync(
+                lambda c, s=schema: sa.inspect(c).get_table_names(
+                    schema=s if use_schema else None
+                )
+            )
+        )
+
+        prefix = "" if use_schema else f"{schema}_"
+        existing = {n[len(prefix) :] for n in names if n.startswith(prefix)}
+
+        # SQLite keeps every schema in one namespace. Schemas whose name
+        # extends ours ("a" and "a_b") also match the prefix, so drop
+        # their tables.
+        if not use_schema:
+            longer = [
+                n[: -len(ROX_ENTITY)]
+                for n in existing
+                if n.endswith(f"_{ROX_ENTITY}")
+            ]
+            existing = {
+                n for n in existing if not any(n.startswith(l) for l in longer)
+            }
+
+        # Without the rox tables the schema is not set up yet
+        if not {ROX_ENTITY, ROX_CHANGELOG, ROX_ASSOCIATION} <= existing:
+            return
+
+        seen = {
+            ROX_ENTITY: await self._build_entity_table(
+                metadata, schema, use_schema
+            ),
+            ROX_CHANGELOG: await self._build_changelog_table(
+                metadata, schema, use_schema, conn.dialect.name
+            ),
+            ROX_ASSOCIATION: await self._build_association_table(
+                metadata, schema, use_schema, conn.dialect.name
+            ),
+        }
+
+        if conn.dialect.name == "postgresql":
+            await self._ensure_generated_ids(
+                conn, schema, [seen[ROX_CHANGELOG], seen[ROX_ASSOCIATION]]
+            )
+
+        for table_name in existing - seen.keys():
+            key = (
+                f"{schema}.{table_name}"
+                if use_schema
+                else f"{prefix}{table_name}"
+            )
+
+            # Already defined by an earlier lazy fetch
+            tbl = metadata.tables.get(key)
+            if tbl is None:
+                tbl = await self._build_table(
+                    metadata=metadata,
+                    schema=schema,
+                    table_name=table_name,
+                    use_schema=use_schema,
+                )
+            seen[table_name] = tbl
+
+        self._seen[schema] = seen
+
+    def _schema_lock(self, schema: str) -> asyncio.Lock:
+        lock = self._schema_locks.get(schema)
+        if lock is None:
+            lock = self._schema_locks[schema] = asyncio.Lock()
+        return lock
+
     async def _fetch_table(
         self,
         session: AsyncSession,
@@ -437,6 +911,14 @@ class RoxManager:
         model_name: str,
     ) -> sa.Table:
 
+        # Derive the table name from the class name
+        table_name = pascal_to_snake(model_name)
+
+        # Fast path. No await between the check and the return.
+        cached = self._seen.get(schema, _EMPTY).get(table_name)
+        if cached is not None:
+            return cached
+
         rox = self.rox
         metadata = rox.metadata
 
@@ -446,12 +928,9 @@ class RoxManager:
 
         use_schema = engine.dialect.name != "sqlite"
 
-        # Derive the table name from the class name
-        table_name = pascal_to_snake(model_name)
+        async with self._schema_lock(schema):
 
-        async with self._lock:
-
-            # Check if we're aware of it.
+            # Check again, someone may have beaten us to it.
             create_schema = schema not in self._seen
             if not create_schema:
                 if table_name in self._seen[schema]:
@@ -502,7 +981,11 @@ class RoxManager:
             sa.Column("id", sa.UUID, primary_key=True),
             sa.Column("version", sa.Integer, nullable=False),
             sa.Column("revision", sa.BigInteger, nullable=False, default=0),
-            sa.Column("model", sa.JSON, nullable=False),
+            sa.Column(
+                "model",
+                sa.JSON().with_variant(postgresql.JSONB(), "postgresql"),
+                nullable=False,
+            ),
             sa.Column(
                 "last_updated_at",
                 sa.DateTime,
@@ -533,20 +1016,28 @@ class RoxManager:
         if use_schema:
             await conn.execute(CreateSchema(schema, if_not_exists=True))
 
-        # Make sure we have an entity table
-        tbl = await self._build_entity_table(metadata, schema, use_schema)
-        await conn.run_sync(tbl.create, checkfirst=True)
-        rc[ROX_ENTITY] = tbl
+        # Entity, changelog and association tables
+        rc[ROX_ENTITY] = await self._build_entity_table(
+            metadata, schema, use_schema
+        )
+        rc[ROX_CHANGELOG] = await self._build_changelog_table(
+            metadata, schema, use_schema, conn.dialect.name
+        )
+        rc[ROX_ASSOCIATION] = await self._build_association_table(
+            metadata, schema, use_schema, conn.dialect.name
+        )
 
-        # Make sure we have a changelog table
-        tbl = await self._build_changelog_table(metadata, schema, use_schema)
-        await conn.run_sync(tbl.create, checkfirst=True)
-        rc[ROX_CHANGELOG] = tbl
+        # Create whichever are missing in one pass, ordered by dependency
+        await conn.run_sync(
+            metadata.create_all,
+            tables=list(rc.values()),
+            checkfirst=True,
+        )
 
-        # Make sure we have an association table
-        tbl = await self._build_association_table(metadata, schema, use_schema)
-        await conn.run_sync(tbl.create, checkfirst=True)
-        rc[ROX_ASSOCIATION] = tbl
+        if conn.dialect.name == "postgresql":
+            await self._ensure_generated_ids(
+                conn, schema, [rc[ROX_CHANGELOG], rc[ROX_ASSOCIATION]]
+            )
 
         print(f"Created Rox tables in schema {schema}: {rc}")
 
@@ -585,11 +1076,54 @@ class RoxManager:
             schema=schema if use_schema else None,
         )
 
+    def _generated_id_column(self, dialect_name: str) -> sa.Column:
+        # PostgreSQL generates the id itself, others get it from Python
+        if dialect_name == "postgresql":
+            return sa.Column(
+                "id",
+                sa.UUID,
+                primary_key=True,
+                server_default=sa.text("gen_random_uuid()"),
+            )
+        return sa.Column("id", sa.UUID, primary_key=True, default=uuid.uuid4)
+
+    async def _ensure_generated_ids(
+        self,
+        conn: AsyncConnection,
+        schema: str,
+        tables: typing.Iterable[sa.Table],
+    ):
+        by_name = {tbl.name: tbl for tbl in tables}
+
+        # Only tables created before the server default existed lack it.
+        # ALTER TABLE takes an exclusive lock, so never issue it needlessly.
+        result = await conn.execute(
+            sa.text(
+                "SELECT table_name FROM information_schema.columns "
+                "WHERE table_schema = :schema "
+                "AND table_name IN :names "
+                "AND column_name = 'id' "
+                "AND column_default IS NULL"
+            ).bindparams(sa.bindparam("names", expanding=True)),
+            {"schema": schema, "names": list(by_name)},
+        )
+
+        preparer = conn.dialect.identifier_preparer
+        for (name,) in result.all():
+            tbl = by_name[name]
+            await conn.execute(
+                sa.text(
+                    f"ALTER TABLE {preparer.format_table(tbl)} "
+                    "ALTER COLUMN id SET DEFAULT gen_random_uuid()"
+                )
+            )
+
     async def _build_changelog_table(
         self,
         metadata: sa.MetaData,
         schema: str,
         use_schema: bool,
+        dialect_name: str,
     ) -> sa.Table:
 
         if use_schema:
@@ -602,7 +1136,7 @@ class RoxManager:
         return sa.Table(
             tname,
             metadata,
-            sa.Column("id", sa.UUID, primary_key=True),
+            self._generated_id_column(dialect_name),
             sa.Column(
                 "oid",
                 sa.UUID,
@@ -628,6 +1162,7 @@ class RoxManager:
         metadata: sa.MetaData,
         schema: str,
         use_schema: bool,
+        dialect_name: str,
     ) -> sa.Table:
 
         if use_schema:
@@ -640,7 +1175,7 @@ class RoxManager:
         return sa.Table(
             tname,
             metadata,
-            sa.Column("id", sa.UUID, primary_key=True),
+            self._generated_id_column(dialect_name),
             sa.Column(
                 "parent_id",
                 sa.UUID,
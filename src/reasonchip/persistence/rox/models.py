@@ -1,10 +1,19 @@
 from __future__ import annotations
 
 import uuid
+import enum
+import types
 import typing
+import datetime
+import asyncio
+import logging
+import functools
+import collections.abc
 
 import sqlalchemy as sa
 
+from dataclasses import dataclass, field
+
 from pydantic import (
     BaseModel,
     Field,
@@ -19,6 +28,117 @@ from .manager import (
 
 RX = typing.TypeVar("RX", bound="RoxModel")
 
+# Exact types that can never contain a RoxModel
+_SCALAR_TYPES = frozenset(
+    {str, int, float, bool, type(None), uuid.UUID, datetime.datetime}
+)
+
+
+# Generic origins whose contents are fully described by their arguments
+_CONTAINER_ORIGINS = frozenset(
+    {
+        typing.Union,
+        types.UnionType,
+        list,
+        dict,
+        set,
+        frozenset,
+        tuple,
+        collections.abc.Sequence,
+        collections.abc.Mapping,
+    }
+)
+
+
+def _may_hold_rox(annotation: typing.Any) -> bool:
+    # Only annotations built purely from known scalars are safe to dump.
+    # Anything else, including bare containers and other models, might
+    # carry a RoxModel and must be walked.
+    if annotation in _SCALAR_TYPES or annotation is Ellipsis:
+        return False
+
+    if isinstance(annotation, type) and issubclass(annotation, enum.Enum):
+        return False
+
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+
+    if origin is typing.Literal:
+        return False
+
+    if origin is typing.Annotated:
+        return _may_hold_rox(args[0])
+
+    if origin in _CONTAINER_ORIGINS and args:
+        return any(_may_hold_rox(a) for a in args)
+
+    return True
+
+
+@functools.cache
+def is_leaf_model(cls: typing.Type[RoxModel]) -> bool:
+    """
+    True when no field of the model can contain another RoxModel, so it
+    can be dumped in one go instead of walked field by field.
+    """
+    return not any(
+        _may_hold_rox(f.annotation) for f in cls.model_fields.values()
+    )
+
+
+@dataclass(slots=True)
+class SaveBatch:
+    """
+    Writes collected while walking an object tree, so that new objects of
+    the same model are created together and associations are only set once
+    every entity they point at exists.
+    """
+
+    creates: typing.Dict[
+        typing.Tuple[str, str, bool],
+        typing.List[
+            typing.Tuple[uuid.UUID, int, int, typing.Dict[str, typing.Any]]
+        ],
+    ] = field(default_factory=dict)
+
+    associations: typing.List[
+        typing.Tuple[str, uuid.UUID, typing.List[RoxAssociation]]
+    ] = field(default_factory=list)
+
+    async def flush(self, session: sa.AsyncSession, manager: RoxManager):
+        for (schema, model_name, changelog), rows in self.creates.items():
+            if len(rows) == 1:
+                oid, version, revision, obj = rows[0]
+                await manager.create(
+                    session=session,
+                    model_name=model_name,
+                    schema=schema,
+                    oid=oid,
+                    version=version,
+                    revision=revision,
+                    obj=obj,
+                    changelog=changelog,
+                )
+            else:
+                await manager.bulk_create(
+                    session=session,
+                    schema=schema,
+                    model_name=model_name,
+                    rows=rows,
+                    changelog=changelog,
+                )
+
+        for schema, oid, associations in self.associations:
+            await manager.set_entity_associations(
+                session=session,
+                schema=schema,
+                oid=oid,
+                associations=associations,
+            )
+
+        self.creates.clear()
+        self.associations.clear()
+
 
 class RoxModel(BaseModel):
 
@@ -45,11 +165,9 @@ class RoxModel(BaseModel):
         session: typing.Optional[sa.AsyncSession] = None,
     ) -> typing.Optional[RX]:
 
-        # Retrieve a session
+        # Retrieve a session, sharing the load with anyone already after it
         if session is None:
-            rox = Rox.get_instance()
-            async with RoxSession(rox) as session:
-                return await cls.load(oid=oid, session=session)
+            return await cls._shared_load(oid)
 
         # Perform the load operation
         obj = await cls._recursive_load(
@@ -64,6 +182,53 @@ class RoxModel(BaseModel):
         obj._dirty = False
         return obj
 
+    # In-flight sessionless loads: (schema, model, oid) -> [task, callers]
+    _inflight: typing.ClassVar[
+        typing.Dict[typing.Tuple[str, str, uuid.UUID], typing.List[typing.Any]]
+    ] = {}
+
+    @classmethod
+    async def _shared_load(
+        cls: typing.Type[RX],
+        oid: uuid.UUID,
+    ) -> typing.Optional[RX]:
+
+        key = (cls._schema, cls.__name__, oid)
+
+        entry = RoxModel._inflight.get(key)
+        if entry is None:
+
+            async def _load() -> typing.Optional[RX]:
+                rox = Rox.get_instance()
+                async with RoxSession(rox) as session:
+                    return await cls.load(oid=oid, session=session)
+
+            # The load runs in its own task so a cancelled caller can't
+            # take it down for everyone else waiting on it.
+            task = asyncio.get_running_loop().create_task(_load())
+            entry = [task, 0]
+            RoxModel._inflight[key] = entry
+
+            def _done(_: asyncio.Task):
+                if RoxModel._inflight.get(key) is entry:
+                    del RoxModel._inflight[key]
+
+            task.add_done_callback(_done)
+
+        entry[1] += 1
+        try:
+            obj = await asyncio.shield(entry[0])
+        finally:
+            entry[1] -= 1
+
+        # The last caller out keeps the original, everyone else a copy
+        if obj is None or entry[1] == 0:
+            return obj
+
+        rc = obj.model_copy(deep=True)
+        rc._dirty = False
+        return rc
+
     async def save(
         self,
         session: typing.Optional[sa.AsyncSession] = None,
@@ -76,23 +241,32 @@ class RoxModel(BaseModel):
                 return await self.save(session=session)
 
         # Perform the save operation
+        batch = SaveBatch()
+        oid = await self._save(session=session, batch=batch)
+
+        # Write the new objects and all associations
+        await batch.flush(session, self.manager())
+        return oid
+
+    async def _save(
+        self,
+        session: sa.AsyncSession,
+        batch: SaveBatch,
+    ) -> uuid.UUID:
+
         associations: typing.List[RoxAssociation] = []
         await self._recursive_save_and_replace(
             session=session,
             obj=self,
             depth=0,
             associations=associations,
+            batch=batch,
         )
 
         assert self.id is not None
 
-        # Update all associations
-        await self.manager().set_entity_associations(
-            session=session,
-            schema=self._schema,
-            oid=self.id,
-            associations=associations,
-        )
+        # Associations are set once all new entities exist
+        batch.associations.append((self._schema, self.id, associations))
 
         self._dirty = False
         return self.id
@@ -123,9 +297,11 @@ class RoxModel(BaseModel):
 
     @classmethod
     def manager(cls) -> RoxManager:
-        if not cls._manager:
-            cls._manager = RoxManager.get_instance()
-        return cls._manager
+        mgr = cls._manager
+        if mgr is None:
+            # Set on the base so every subclass shares the lookup
+            mgr = RoxModel._manager = RoxManager.get_instance()
+        return mgr
 
     # ------------ SAVING METHODS --------------------------------------------
 
@@ -135,6 +311,7 @@ class RoxModel(BaseModel):
         obj: typing.Any,
         depth: int,
         associations: typing.List[RoxAssociation],
+        batch: SaveBatch,
     ):
         """
         NOTE:
@@ -144,7 +321,7 @@ class RoxModel(BaseModel):
 
         If it finds another RoxModel, it will:
 
-        1. Call save on that model so it can do it's thing.
+        1. Save that model into the same batch so it can do it's thing.
         2. Replace the storage reference with a dict that contains the
             reference to the other reference.
 
@@ -152,10 +329,14 @@ class RoxModel(BaseModel):
         not any sub-RoxModels) within the provided parameter.
         """
 
+        # Most values are plain leaves, so get those out of the way first
+        if type(obj) in _SCALAR_TYPES:
+            return obj
+
         if isinstance(obj, RoxModel):
             # We are not saving ourselves, we're saving a child.
             if depth > 0:
-                new_id = await obj.save(session=session)
+                new_id = await obj._save(session=session, batch=batch)
 
                 # Keep track of associations
                 associations.append(
@@ -165,11 +346,7 @@ class RoxModel(BaseModel):
                     )
                 )
 
-                return {
-                    "__ref__": new_id,
-                    "__rox__": obj.__class__.__name__,
-                    "__schema__": obj.__class__._schema,
-                }
+                return {"__ref__": new_id, **obj.__class__._rox_ref}
 
             # We are saving ourselves
             assert obj == self
@@ -181,30 +358,41 @@ class RoxModel(BaseModel):
                 obj._revision = 1
 
             # Iterate over the fields of the object
-            result = {}
-            for name in obj.__class__.model_fields.keys():
-                value = getattr(obj, name)
-                result[name] = await self._recursive_save_and_replace(
-                    session=session,
-                    obj=value,
-                    depth=depth + 1,
-                    associations=associations,
-                )
+            if is_leaf_model(obj.__class__):
+                result = obj.model_dump()
+            else:
+                result = {}
+                values = obj.__dict__
+                for name in obj.__class__._rox_fields:
+                    result[name] = await self._recursive_save_and_replace(
+                        session=session,
+                        obj=values[name],
+                        depth=depth + 1,
+                        associations=associations,
+                        batch=batch,
+                    )
 
             # Save the object to the database here
             if obj.is_dirty():
                 if create:
-                    await self.manager().create(
+                    key = (obj._schema, obj.__class__.__name__, obj._changelog)
+                    batch.creates.setdefault(key, []).append(
+                        (obj.id, obj._version, obj._revision, result)
+                    )
+                elif (
+                    obj._changelog
+                    or not await self.manager().update_if_revision(
                         session=session,
-                        model_name=obj.__class__.__name__,
                         schema=obj._schema,
+                        model_name=obj.__class__.__name__,
+                        oid=obj.id,
+                        expected_revision=obj._revision - 1,
                         version=obj._version,
                         revision=obj._revision,
-                        oid=obj.id,
                         obj=result,
-                        changelog=obj._changelog,
                     )
-                else:
+                ):
+                    # Changelogs need the old row, as does a revision clash
                     await self.manager().update(
                         session=session,
                         schema=obj._schema,
@@ -216,30 +404,35 @@ class RoxModel(BaseModel):
                     )
 
             # Return the reference
-            return {
-                "__ref__": obj.id,
-                "__rox__": obj.__class__.__name__,
-                "__schema__": obj.__class__._schema,
-            }
+            return {"__ref__": obj.id, **obj.__class__._rox_ref}
 
         elif isinstance(obj, list):
+            # Nothing to replace in a list of plain values
+            if all(type(i) in _SCALAR_TYPES for i in obj):
+                return list(obj)
+
             return [
                 await self._recursive_save_and_replace(
                     session=session,
                     obj=i,
                     depth=depth + 1,
                     associations=associations,
+                    batch=batch,
                 )
                 for i in obj
             ]
 
         elif isinstance(obj, dict):
+            if all(type(v) in _SCALAR_TYPES for v in obj.values()):
+                return dict(obj)
+
             return {
                 k: await self._recursive_save_and_replace(
                     session=session,
                     obj=v,
                     depth=depth + 1,
                     associations=associations,
+                    batch=batch,
                 )
                 for k, v in obj.items()
             }
@@ -256,9 +449,7 @@ class RoxModel(BaseModel):
         if not existing_row:
             return (self._version, self._revision, obj)
 
-        version = existing_row[0]
-        revision = existing_row[1]
-        old_obj = existing_row[2]
+        version, revision, old_obj = existing_row
 
         # NOTE:
         # 1. It's okay for versions to be different.
@@ -295,9 +486,7 @@ class RoxModel(BaseModel):
         if row is None:
             return None
 
-        version = row[0]
-        revision = row[1]
-        obj = row[2]
+        version, revision, obj = row
 
         if version != cls._version:
             # TODO: Handle migration of object
@@ -310,6 +499,40 @@ class RoxModel(BaseModel):
         rc._revision = revision
         return rc
 
+    @classmethod
+    async def _load_many(
+        cls,
+        session: sa.AsyncSession,
+        oids: typing.Collection[uuid.UUID],
+    ) -> typing.Dict[
+        uuid.UUID, typing.Tuple[int, typing.Dict[str, typing.Any]]
+    ]:
+
+        rows = await cls.manager().load_many(
+            session=session,
+            schema=cls._schema,
+            model_name=cls.__name__,
+            oids=oids,
+        )
+
+        for version, _, _ in rows.values():
+            if version != cls._version:
+                # TODO: Handle migration of object
+                raise ValueError(
+                    f"Version mismatch: {version} != {cls._version}"
+                )
+
+        # Unflatten every loaded object together so the next level batches
+        objs = await cls._unflatten_value(
+            session=session,
+            value=[obj for _, _, obj in rows.values()],
+        )
+
+        return {
+            oid: (revision, obj)
+            for (oid, (_, revision, _)), obj in zip(rows.items(), objs)
+        }
+
     @classmethod
     async def _unflatten_value(
         cls,
@@ -317,33 +540,90 @@ class RoxModel(BaseModel):
         value: typing.Any,
     ) -> typing.Optional[typing.Any]:
 
-        if isinstance(value, dict):
-            # Reference ...
-            if "__ref__" in value and "__rox__" in value:
-                ref = uuid.UUID(value["__ref__"])
-                ref_model_name = value["__rox__"]
-                ref_schema = value["__schema__"]
+        # Find every reference without awaiting anything
+        root = [value]
+        refs: typing.List[
+            typing.Tuple[
+                typing.Any, typing.Any, uuid.UUID, typing.Type[RoxModel]
+            ]
+        ] = []
+        cls._collect_refs(root, refs)
 
-                key_name = f"{ref_schema}.{ref_model_name}"
+        if not refs:
+            return root[0]
 
-                if key_name not in cls._registry:
-                    raise ValueError(
-                        f"Model {key_name} not registered but it's needed to load from the DB."
-                    )
+        # Load the references one model at a time
+        wanted: typing.Dict[typing.Type[RoxModel], typing.Set[uuid.UUID]] = {}
+        for _, _, ref, sub_model in refs:
+            wanted.setdefault(sub_model, set()).add(ref)
+
+        loaded = {
+            sub_model: await sub_model._load_many(session, oids)
+            for sub_model, oids in wanted.items()
+        }
+
+        # Patch the instances back into place
+        for container, key, ref, sub_model in refs:
+            found = loaded[sub_model].get(ref)
+            if found is None:
+                logging.warning("Object with id %s not found.", ref)
+                container[key] = None
+                continue
+
+            revision, obj = found
 
-                sub_model = cls._registry[key_name]
-                return await sub_model.load(oid=ref, session=session)
+            child = sub_model.model_validate(obj)
+            child._revision = revision
+            child._dirty = False
+            container[key] = child
 
-            # Not a reference
-            for name, val in value.items():
-                value[name] = await cls._unflatten_value(session, val)
+        return root[0]
 
-            return value
+    @classmethod
+    def _collect_refs(
+        cls,
+        container: typing.Union[typing.Dict, typing.List],
+        refs: typing.List[
+            typing.Tuple[
+                typing.Any, typing.Any, uuid.UUID, typing.Type[RoxModel]
+            ]
+        ],
+    ):
+        items = (
+            container.items()
+            if isinstance(container, dict)
+            else enumerate(container)
+        )
+
+        for key, value in items:
+            if isinstance(value, dict):
+                # Reference ...
+                if "__ref__" in value and "__rox__" in value:
+                    ref_model_name = value["__rox__"]
+                    ref_schema = value["__schema__"]
+
+                    key_name = f"{ref_schema}.{ref_model_name}"
+
+                    if key_name not in cls._registry:
+                        raise ValueError(
+                            f"Model {key_name} not registered but it's needed to load from the DB."
+                        )
+
+                    refs.append(
+                        (
+                            container,
+                            key,
+                            uuid.UUID(str(value["__ref__"])),
+                            cls._registry[key_name],
+                        )
+                    )
+                    continue
 
-        if isinstance(value, list):
-            return [await cls._unflatten_value(session, x) for x in value]
+                # Not a reference
+                cls._collect_refs(value, refs)
 
-        return value
+            elif isinstance(value, list):
+                cls._collect_refs(value, refs)
 
     # ------------ DIRTY MANAGEMENT ------------------------------------------
 
@@ -364,6 +644,8 @@ class RoxModel(BaseModel):
     # ------------ FACTORY REGISTRY ------------------------------------------
 
     _registry: typing.ClassVar[typing.Dict[str, typing.Type[RoxModel]]] = {}
+    _rox_fields: typing.ClassVar[typing.Tuple[str, ...]] = ()
+    _rox_ref: typing.ClassVar[typing.Dict[str, str]] = {}
 
     def __init_subclass__(cls):
         super().__init_subclass__()
@@ -376,3 +658,16 @@ class RoxModel(BaseModel):
             )
 
         cls._registry[key_name] = cls
+
+        # Everything but the id of a stored reference to this class
+        cls._rox_ref = {"__rox__": cls.__name__, "__schema__": cls._schema}
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+
+        # Fields are only known once pydantic has finished building the class
+        cls._rox_fields = tuple(cls.model_fields.keys())
+
+
+RoxModel._rox_fields = tuple(RoxModel.model_fields.keys())
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import typing
+import asyncio
+import orjson
 import sqlalchemy as sa
 
 from pydantic import BaseModel, Field
@@ -10,9 +12,14 @@ from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_engine_from_config,
+    async_sessionmaker,
 )
 
 
+def json_serializer(obj: typing.Any) -> str:
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 class RoxConfiguration(BaseModel):
     url: str = Field(default="sqlite+aiosqlite:///./rox.sqlite")
     pool_size: int = Field(default=1, ge=1)
@@ -41,9 +48,15 @@ class Rox:
         engine = async_engine_from_config(
             configuration.model_dump(),
             prefix="",
+            json_serializer=json_serializer,
+            json_deserializer=orjson.loads,
         )
 
         self._engine: AsyncEngine = engine
+        self._session_factory: async_sessionmaker[AsyncSession] = (
+            async_sessionmaker(engine, expire_on_commit=False)
+        )
+        self._pool_size: int = configuration.pool_size
         self._metadata: sa.MetaData = sa.MetaData()
 
         Rox._initialized = True
@@ -54,12 +67,30 @@ class Rox:
     def engine(self) -> AsyncEngine:
         return self._engine
 
+    @property
+    def session_factory(self) -> async_sessionmaker[AsyncSession]:
+        return self._session_factory
+
     @property
     def metadata(self) -> sa.MetaData:
         return self._metadata
 
     # ------------------------ METHODS ---------------------------------------
 
+    async def warmup(self, n: typing.Optional[int] = None):
+        """
+        Open and return n connections so the pool is populated before
+        the first request arrives. Defaults to the configured pool size.
+        """
+        n = self._pool_size if n is None else n
+        if n <= 0:
+            return
+
+        conns = await asyncio.gather(
+            *[self._engine.connect() for _ in range(n)]
+        )
+        await asyncio.gather(*[c.close() for c in conns])
+
     @classmethod
     def get_instance(cls) -> Rox:
         if not cls._instance:
@@ -75,7 +106,7 @@ class RoxSession:
 
     async def __aenter__(self) -> AsyncSession:
         assert self._session is None
-        self._session = AsyncSession(self._rox.engine)
+        self._session = self._rox.session_factory()
         return await self._session.__aenter__()
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -1,6 +1,12 @@
 import re
+import functools
 
 
+_FIRST_CAP = re.compile(r"(.)([A-Z][a-z]+)")
+_ALL_CAP = re.compile(r"([a-z0-9])([A-Z])")
+
+
+@functools.lru_cache(maxsize=1024)
 def pascal_to_snake(name: str) -> str:
-    s1 = re.sub(r"(.)([A-Z][a-z]+)", r"\1_\2", name)
-    return re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
+    s1 = _FIRST_CAP.sub(r"\1_\2", name)
+    return _ALL_CAP.sub(r"\1_\2", s1).lower()
@@ -15,14 +15,14 @@ class LocalRunner:
     def __init__(
         self,
         collections: typing.List[str],
-        default_variables: typing.Dict[str, typing.Any] = {},
+        default_variables: typing.Optional[typing.Dict[str, typing.Any]] = None,
     ):
         # Create the engine
         self._engine: Engine = Engine()
         self._engine.initialize(pipelines=collections)
 
         # Create the variables
-        self._default_variables: Variables = Variables(default_variables)
+        self._default_variables: Variables = Variables(default_variables or {})
 
     @property
     def engine(self) -> Engine:
@@ -31,12 +31,13 @@ class LocalRunner:
     async def run(
         self,
         pipeline: str,
-        variables: typing.Dict[str, typing.Any] = {},
+        variables: typing.Optional[typing.Dict[str, typing.Any]] = None,
     ) -> typing.Any:
 
         # Create the variables
         new_vars = self._default_variables.copy()
-        new_vars.update(variables)
+        if variables:
+            new_vars.update(variables)
 
         # Run the engine
         return await self._engine.run(pipeline, new_vars)
@@ -0,0 +1,50 @@
+import asyncio
+
+import sqlalchemy as sa
+
+from reasonchip.persistence.rox.rox import Rox, RoxConfiguration
+from reasonchip.persistence.rox.manager import (
+    RoxManager,
+    ROX_ENTITY,
+    ROX_CHANGELOG,
+    ROX_ASSOCIATION,
+)
+
+ROX_TABLES = {ROX_ENTITY, ROX_CHANGELOG, ROX_ASSOCIATION}
+
+
+async def _create_schema(conn, schema: str, table_name: str):
+    # Lay down a schema the way a previous process would have
+    manager = RoxManager()
+    metadata = sa.MetaData()
+    await manager._build_rox_tables(conn, metadata, schema, False)
+    tbl = await manager._build_table(metadata, schema, table_name, False)
+    await conn.run_sync(tbl.create)
+
+
+def test_preload_prefix_schemas_on_sqlite(tmp_path, monkeypatch):
+    monkeypatch.setattr(Rox, "_instance", None)
+    monkeypatch.setattr(Rox, "_initialized", False)
+
+    rox = Rox(RoxConfiguration(url=f"sqlite+aiosqlite:///{tmp_path}/rox.db"))
+
+    async def run():
+        async with rox.engine.begin() as conn:
+            await _create_schema(conn, "a", "thing")
+            await _create_schema(conn, "a_b", "other")
+
+        manager = RoxManager()
+        manager._rox = rox
+
+        # "a" is a prefix of "a_b"; its tables must not be adopted by "a"
+        await manager.preload(["a", "a_b"])
+
+        await rox.engine.dispose()
+        return manager._seen
+
+    seen = asyncio.run(run())
+
+    assert set(seen["a"]) == ROX_TABLES | {"thing"}
+    assert set(seen["a_b"]) == ROX_TABLES | {"other"}
+    assert seen["a"]["thing"].name == "a_thing"
+    assert seen["a_b"][ROX_ENTITY].name == "a_b_rox_entity"
@@ -5,6 +5,7 @@ import argparse
 import importlib
 import textwrap
 import datetime
+import functools
 
 from jinja2 import Environment
 import markdown
@@ -14,13 +15,16 @@ from collections import defaultdict
 from reasonchip.core.engine.registry import Registry, RegistryLoader
 
 
+# Shared converter, reset before each use
+_MD = markdown.Markdown(extensions=['extra'])
+
+
+@functools.lru_cache(maxsize=None)
 def markdown_to_html(value):
     if not value:
         return ""
-    return markdown.markdown(
-        textwrap.dedent(value),
-        extensions=['extra'],
-    )
+    _MD.reset()
+    return _MD.convert(textwrap.dedent(value))
 
 
 def generate_module_docs(
@@ -46,11 +50,14 @@ def generate_module_docs(
     # Group chips by module
     modules = defaultdict(list)
     for chip_name, entry in chips.items():
-        remove_str = "reasonchip.chipsets."
-        chip_name = chip_name.replace(remove_str, "")
+        chip_name = chip_name.removeprefix("reasonchip.chipsets.")
         modules[entry.func.__module__].append((chip_name, entry))
 
+    # Every page carries the same generation date
+    today = datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%d")
+
     # Generate documentation for each module
+    entries = []
     for module_name, chips_in_module in modules.items():
 
         # Load the module to access its docstring
@@ -69,31 +76,31 @@ def generate_module_docs(
             "url_path": url_path,
             "module_doc": module_doc,
             "chips_in_module": chips_in_module,
-            "today": datetime.datetime.utcnow().strftime("%Y-%m-%d"),
+            "today": today,
         }
 
-        # Chip template is a Jinja2 template
-        html = tmpl.render(ctx)
+        # Chip template is a Jinja2 template, streamed straight to file
+        file_stem = mod_name.replace('.', '_')
+        module_filename = os.path.join(output_dir, f"{file_stem}.html")
+        with open(module_filename, "wb") as f:
+            tmpl.stream(ctx).dump(f, encoding="utf-8")
 
+        print(f"Generated {module_filename}")
 
-        # Write to file
-        module_filename = os.path.join(output_dir, f"{mod_name.replace('.', '_')}.html")
-        with open(module_filename, "w", encoding="utf-8") as f:
-            f.write(html)
+        entries.append((file_stem, mod_name))
 
-        print(f"Generated {module_filename}")
+    return sorted(entries)
 
 
-def generate_menu(menu_file: str, output_dir: str):
+def generate_menu(menu_file: str, entries):
     """ Generate a Hugo menu file listing all modules. """
-    module_files = sorted(f for f in os.listdir(output_dir) if f.endswith(".html"))
-
-    menu_content = "<!-- Auto-generated menu -->\n"
-    menu_content += "<ul>\n"
-    for module_file in module_files:
-        module_name = module_file.replace(".html", "").replace("_", ".")
-        menu_content += f'  <li><a href="/chipsets/{module_file.replace(".html", "")}/">{module_name}</a></li>\n'
-    menu_content += "</ul>\n"
+    lines = ["<!-- Auto-generated menu -->\n", "<ul>\n"]
+    lines.extend(
+        f'  <li><a href="/chipsets/{file_stem}/">{module_name}</a></li>\n'
+        for file_stem, module_name in entries
+    )
+    lines.append("</ul>\n")
+    menu_content = "".join(lines)
 
     with open(menu_file, "w", encoding="utf-8") as f:
         f.write(menu_content)
@@ -123,8 +130,8 @@ def main():
     with open(args.chipset_template, "r", encoding="utf-8") as f:
         chip_template = f.read()
 
-    generate_module_docs(args.out_dir, chip_template)
-    generate_menu(args.out_menu, args.out_dir)
+    entries = generate_module_docs(args.out_dir, chip_template)
+    generate_menu(args.out_menu, entries)
 
 
 if __name__ == "__main__":